@@ -37,6 +37,7 @@ if not API_KEY or not API_SECRET:
 DEFAULT_SYMBOL = "BTCUSDT"  # Default trading pair
 DEFAULT_TRADE_SIZE = 0.001   # Default trade quantity
 MAX_RETRIES = 3              # Maximum retry attempts for API calls
+SYMBOL_INFO_TTL = 3600       # Seconds to reuse cached exchange info for a symbol
 
 TRADING_PAIRS = {
     'BTC': 'BTCUSDT',
@@ -61,6 +62,32 @@ STATUS_EMOJIS = {
     'EXPIRED': '⏰'
 }
 
+STATUS_COLORS = {
+    'NEW': 'blue',
+    'PARTIALLY_FILLED': 'yellow',
+    'FILLED': 'green',
+    'CANCELED': 'red',
+    'REJECTED': 'red',
+    'EXPIRED': 'red'
+}
+
+# CLI order type -> Binance order type
+ORDER_TYPES = {
+    'MARKET': ORDER_TYPE_MARKET,
+    'LIMIT': ORDER_TYPE_LIMIT,
+    'STOP_MARKET': ORDER_TYPE_STOP_LOSS
+}
+
+TRADING_MODES = {
+    'MARKET': 'Instant execution at market price',
+    'LIMIT': 'Place order at specific price',
+    'STOP_MARKET': 'Market order triggered at stop price',
+    'TWAP': 'Time-Weighted Average Price execution',
+    'GRID': 'Grid trading strategy',
+    'ACCOUNT': 'View account balances',
+    'EXIT': 'Exit the program'
+}
+
 class BasicBot:
     def __init__(self, api_key, api_secret):
         self.client = Client(api_key, api_secret)
@@ -71,20 +98,35 @@ class BasicBot:
             testnet=True
         )
         self.twm.start()
+        self._symbol_info_cache = {}
         console.print("Bot initialized with spot testnet configuration")
         self.verify_spot_access()
 
-    def place_order(self, symbol, side, order_type, quantity, price=None, stop_price=None):
+    def get_symbol_info(self, symbol):
+        """Return exchange info for a symbol, refetching it once the cached copy expires"""
+        cached = self._symbol_info_cache.get(symbol)
+        if cached and time.monotonic() - cached[1] < SYMBOL_INFO_TTL:
+            return cached[0]
+        symbol_info = self.client.get_symbol_info(symbol)
+        if symbol_info:
+            self._symbol_info_cache[symbol] = (symbol_info, time.monotonic())
+        return symbol_info
+
+    def place_order(self, symbol, side, order_type, quantity, price=None, stop_price=None, symbol_info=None):
+        current_price = None
         try:
-            symbol_info = self.client.get_symbol_info(symbol)
+            # Callers that already validated the symbol pass its info in
+            if symbol_info is None:
+                symbol_info = self.get_symbol_info(symbol)
             if not symbol_info:
                 console.print(f"[red]Error: Trading pair {symbol} not found[/red]")
                 return None
             ticker = self.client.get_symbol_ticker(symbol=symbol)
             current_price = float(ticker['price'])
-            lot_size_filter = next((f for f in symbol_info['filters'] if f['filterType'] == 'LOT_SIZE'), None)
-            notional_filter = next((f for f in symbol_info['filters'] if f['filterType'] == 'MIN_NOTIONAL'), None)
-            price_filter = next((f for f in symbol_info['filters'] if f['filterType'] == 'PRICE_FILTER'), None)
+            filters = self._get_filters(symbol_info)
+            lot_size_filter = filters.get('LOT_SIZE')
+            notional_filter = filters.get('MIN_NOTIONAL')
+            price_filter = filters.get('PRICE_FILTER')
             if lot_size_filter:
                 min_qty = float(lot_size_filter['minQty'])
                 max_qty = float(lot_size_filter['maxQty'])
@@ -116,47 +158,29 @@ class BasicBot:
             if notional_filter:
                 min_notional = float(notional_filter['minNotional'])
                 order_value = quantity * (price or current_price)
-                print(f"Debug: Order value = {order_value}, Min notional = {min_notional}")  # Debug print
+                logger.debug("Order value = %s, Min notional = %s", order_value, min_notional)
 
                 if order_value < min_notional:
-                    print(f"Debug: Order value too small, showing panel")  # Debug print
-                    min_qty = 5.0 / (price or current_price)  # Using fixed 5 USDT minimum
-                    console.print(Panel(
-                        f"[red]❌ Order value (${order_value:.2f} USDT) is too small[/red]\n" +
-                        f"[white]Binance requires minimum trade value of $5.00 USDT[/white]\n" +
-                        f"[yellow]Your order value: {quantity} {symbol_info['baseAsset']} × ${price or current_price:.4f} = ${order_value:.2f} USDT[/yellow]\n" +
-                        f"[green]💡 Suggested minimum quantity: {min_qty:.6f} {symbol_info['baseAsset']}[/green]",
-                        title="⚠️ Minimum Trade Value Not Met",
-                        border_style="red"
-                    ))
-                    print("Debug: Panel should be displayed")  # Debug print
+                    self._show_min_notional_panel(quantity, symbol_info['baseAsset'], price or current_price)
                     return None
 
             # Proceed with order placement
             order_params = {
                 'symbol': symbol,
                 'side': side,
+                'type': ORDER_TYPES[order_type],
                 'quantity': quantity
             }
+            if order_type == 'LIMIT':
+                order_params['timeInForce'] = TIME_IN_FORCE_GTC
+                order_params['price'] = price
+            elif order_type == 'STOP_MARKET':
+                order_params['stopPrice'] = stop_price
 
-            logger.info(f"Placing {order_type} order - Symbol: {symbol}, Side: {side}, Quantity: {quantity}")
+            logger.info("Placing %s order - Symbol: %s, Side: %s, Quantity: %s", order_type, symbol, side, quantity)
             log_order(order_type, symbol, side, quantity, price)
 
             with console.status(f"[bold blue]Placing order...") as status:
-                if order_type == 'MARKET':
-                    order_params['type'] = ORDER_TYPE_MARKET
-                elif order_type == 'LIMIT':
-                    order_params.update({
-                        'type': ORDER_TYPE_LIMIT,
-                        'timeInForce': TIME_IN_FORCE_GTC,
-                        'price': price
-                    })
-                elif order_type == 'STOP_MARKET':
-                    order_params.update({
-                        'type': ORDER_TYPE_STOP_LOSS,
-                        'stopPrice': stop_price
-                    })
-
                 order = self.client.create_order(**order_params)
                 timestamp = datetime.fromtimestamp(int(order['transactTime']) / 1000)
 
@@ -184,24 +208,17 @@ class BasicBot:
         except BinanceAPIException as e:
             error_msg = str(e)
             if "MIN_NOTIONAL" in error_msg:
-                # Get current price for calculation
-                ticker = self.client.get_symbol_ticker(symbol=symbol)
-                current_price = float(ticker['price'])
-                order_value = quantity * current_price
-                min_qty = 5.0 / current_price  # Using fixed 5 USDT minimum
-
-                console.print(Panel(
-                    f"[red]❌ Order value (${order_value:.2f} USDT) is too small[/red]\n" +
-                    f"[white]Binance requires minimum trade value of $5.00 USDT[/white]\n" +
-                    f"[yellow]Your order value: {quantity} {symbol.replace('USDT', '')} × ${current_price:.4f} = ${order_value:.2f} USDT[/yellow]\n" +
-                    f"[green]💡 Suggested minimum quantity: {min_qty:.6f} {symbol.replace('USDT', '')}[/green]",
-                    title="⚠️ Minimum Trade Value Not Met",
-                    border_style="red"
-                ))
+                # Reuse the price fetched before placing the order when we have it
+                if current_price is None:
+                    ticker = self.client.get_symbol_ticker(symbol=symbol)
+                    current_price = float(ticker['price'])
+                base_asset = symbol_info['baseAsset'] if symbol_info else symbol.replace('USDT', '')
+                self._show_min_notional_panel(quantity, base_asset, current_price)
             elif "LOT_SIZE" in error_msg:
                 # Get symbol info for lot size
-                symbol_info = self.client.get_symbol_info(symbol)
-                lot_size_filter = next((f for f in symbol_info['filters'] if f['filterType'] == 'LOT_SIZE'), None)
+                if not symbol_info:
+                    symbol_info = self.get_symbol_info(symbol)
+                lot_size_filter = self._get_filters(symbol_info).get('LOT_SIZE')
                 if lot_size_filter:
                     step_size = float(lot_size_filter['stepSize'])
                     valid_qty = self._adjust_to_step_size(quantity, step_size)
@@ -219,14 +236,31 @@ class BasicBot:
                 console.print("[red]Error: Invalid price. Please adjust your price.[/red]")
             else:
                 console.print(f"[red]Binance API Error: {error_msg}[/red]")
-            logger.error(f"Error placing order: {e}")
+            logger.error("Error placing order: %s", e)
             log_error(f"Failed to place {order_type} order for {symbol}: {str(e)}")
         except Exception as e:
             console.print(f"[red]Unexpected error: {str(e)}[/red]")
-            logger.error(f"Error placing order: {e}")
+            logger.error("Error placing order: %s", e)
             log_error(f"Failed to place {order_type} order for {symbol}: {str(e)}")
         return None
 
+    def _get_filters(self, symbol_info):
+        """Index a symbol's exchange filters by filter type"""
+        return {f['filterType']: f for f in symbol_info['filters']}
+
+    def _show_min_notional_panel(self, quantity, base_asset, unit_price):
+        """Show the minimum trade value panel with a suggested quantity"""
+        order_value = quantity * unit_price
+        min_qty = 5.0 / unit_price  # Using fixed 5 USDT minimum
+        console.print(Panel(
+            f"[red]❌ Order value (${order_value:.2f} USDT) is too small[/red]\n" +
+            f"[white]Binance requires minimum trade value of $5.00 USDT[/white]\n" +
+            f"[yellow]Your order value: {quantity} {base_asset} × ${unit_price:.4f} = ${order_value:.2f} USDT[/yellow]\n" +
+            f"[green]💡 Suggested minimum quantity: {min_qty:.6f} {base_asset}[/green]",
+            title="⚠️ Minimum Trade Value Not Met",
+            border_style="red"
+        ))
+
     def _is_valid_step_size(self, quantity, step_size):
         """Check if quantity follows the step size rules"""
         precision = len(str(step_size).split('.')[-1])
@@ -238,47 +272,43 @@ class BasicBot:
 
     def process_order_update(self, msg):
         try:
-            if msg.get('e') == 'executionReport':
-                order_status = msg.get('X')
-                symbol = msg.get('s')
-                order_id = msg.get('i')
-                order_type = msg.get('o')
-                side = msg.get('S')
-                price = msg.get('p')
-                executed_qty = msg.get('z')
-                executed_price = msg.get('L')  # Last executed price
-                timestamp = datetime.fromtimestamp(msg.get('T') / 1000)
-
-                status_colors = {
-                    'NEW': 'blue',
-                    'PARTIALLY_FILLED': 'yellow',
-                    'FILLED': 'green',
-                    'CANCELED': 'red',
-                    'REJECTED': 'red',
-                    'EXPIRED': 'red'
-                }
-
-                table = Table(title=f"Real-time Order Update - {timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
-                table.add_column("Field", style="cyan")
-                table.add_column("Value", style=status_colors.get(order_status, 'white'))
-
-                table.add_row("Order ID", str(order_id))
-                table.add_row("Symbol", symbol)
-                table.add_row("Type", order_type)
-                table.add_row("Side", side)
-                table.add_row("Status", order_status)
-                table.add_row("Price", price)
-                table.add_row("Executed Qty", executed_qty)
-                if executed_price:
-                    table.add_row("Last Executed Price", executed_price)
+            # Only execution reports are rendered; skip everything else up front
+            if msg.get('e') != 'executionReport':
+                return
+            order_status = msg.get('X')
+            symbol = msg.get('s')
+            order_id = msg.get('i')
+            order_type = msg.get('o')
+            side = msg.get('S')
+            price = msg.get('p')
+            executed_qty = msg.get('z')
+            executed_price = msg.get('L')  # Last executed price
+            timestamp = datetime.fromtimestamp(msg.get('T') / 1000)
+
+            table = Table(title=f"Real-time Order Update - {timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
+            table.add_column("Field", style="cyan")
+            table.add_column("Value", style=STATUS_COLORS.get(order_status, 'white'))
+
+            table.add_row("Order ID", str(order_id))
+            table.add_row("Symbol", symbol)
+            table.add_row("Type", order_type)
+            table.add_row("Side", side)
+            table.add_row("Status", order_status)
+            table.add_row("Price", price)
+            table.add_row("Executed Qty", executed_qty)
+            if executed_price:
+                table.add_row("Last Executed Price", executed_price)
 
-                console.print(table)
-                logger.info(f"Real-time update for Order {order_id}: {order_status}")
+            console.print(table)
+            logger.info("Real-time update for Order %s: %s", order_id, order_status)
         except Exception as e:
-            logger.error(f"Error processing order update: {e}")
+            logger.error("Error processing order update: %s", e)
 
-    def twap(self, symbol, side, total_qty, interval_sec, slices):
+    def twap(self, symbol, side, total_qty, interval_sec, slices, symbol_info=None):
         try:
+            # Fetch the symbol rules once rather than once per slice
+            if symbol_info is None:
+                symbol_info = self.get_symbol_info(symbol)
             qty_per_order = round(total_qty / slices, 6)
 
             with Progress(
@@ -293,18 +323,24 @@ class BasicBot:
 
                 for i in range(slices):
                     progress.update(task, description=f"[cyan]Executing slice {i+1}/{slices}")
-                    if not self.place_order(symbol, side, 'MARKET', qty_per_order):
+                    if not self.place_order(symbol, side, 'MARKET', qty_per_order, symbol_info=symbol_info):
                         raise Exception(f"Failed to place order for slice {i+1}")
-                    time.sleep(interval_sec)
                     progress.advance(task)
+                    # No need to wait once the final slice is in
+                    if i < slices - 1:
+                        time.sleep(interval_sec)
 
                 console.print("[green]TWAP execution completed successfully[/green]")
 
         except Exception as e:
             console.print(f"[red]TWAP execution failed: {str(e)}[/red]")
 
-    def grid(self, symbol, lower_price, upper_price, grids, quantity, side):
+    def grid(self, symbol, lower_price, upper_price, grids, quantity, side, symbol_info=None):
         try:
+            # Fetch the symbol rules once rather than once per grid level
+            if symbol_info is None:
+                symbol_info = self.get_symbol_info(symbol)
+
             # Get current price
             ticker = self.client.get_symbol_ticker(symbol=symbol)
             current_price = float(ticker['price'])
@@ -371,7 +407,7 @@ class BasicBot:
 
                 for i in range(grids):
                     price = round(lower_price + i * price_step, 8)
-                    if not self.place_order(symbol, side, 'LIMIT', quantity, price):
+                    if not self.place_order(symbol, side, 'LIMIT', quantity, price, symbol_info=symbol_info):
                         console.print(f"[red]Failed to place grid order {i+1}[/red]")
                         if not Confirm.ask("Do you want to continue placing remaining orders?"):
                             break
@@ -390,13 +426,18 @@ class BasicBot:
             }
             account_info = self.client.get_account(**params)
 
-            # Filter balances to show only coins with non-zero balance
-            non_zero_balances = [{
-                'asset': balance['asset'],
-                'free': float(balance['free']),
-                'locked': float(balance['locked'])
-            } for balance in account_info['balances']
-                if float(balance['free']) > 0 or float(balance['locked']) > 0]
+            # Filter balances to show only coins with non-zero balance,
+            # parsing each amount once
+            non_zero_balances = []
+            for balance in account_info['balances']:
+                free = float(balance['free'])
+                locked = float(balance['locked'])
+                if free > 0 or locked > 0:
+                    non_zero_balances.append({
+                        'asset': balance['asset'],
+                        'free': free,
+                        'locked': locked
+                    })
 
             if non_zero_balances:
                 # Create and style the table
@@ -422,7 +463,7 @@ class BasicBot:
     def validate_symbol(self, symbol):
         try:
             # Get symbol info from Binance API
-            symbol_info = self.client.get_symbol_info(symbol)
+            symbol_info = self.get_symbol_info(symbol)
 
             if not symbol_info:
                 raise ValueError(f"Trading pair {symbol} not found")
@@ -431,9 +472,10 @@ class BasicBot:
                 raise ValueError(f"Spot trading is not allowed for {symbol}")
 
             # Find the LOT_SIZE filter
-            lot_size_filter = next((f for f in symbol_info['filters'] if f['filterType'] == 'LOT_SIZE'), None)
+            filters = self._get_filters(symbol_info)
+            lot_size_filter = filters.get('LOT_SIZE')
             # Find the PRICE_FILTER
-            price_filter = next((f for f in symbol_info['filters'] if f['filterType'] == 'PRICE_FILTER'), None)
+            price_filter = filters.get('PRICE_FILTER')
 
             # Create info table
             table = Table(title=f"Symbol Information - {symbol}", show_header=True)
@@ -456,7 +498,7 @@ class BasicBot:
             return symbol_info
 
         except BinanceAPIException as e:
-            logger.error(f"Failed to validate symbol {symbol}: {e}")
+            logger.error("Failed to validate symbol %s: %s", symbol, e)
             raise ValueError(f"Failed to validate symbol {symbol}: {e}")
 
     def verify_spot_access(self):
@@ -471,7 +513,7 @@ class BasicBot:
                 logger.error("Spot trading is not enabled for this account")
                 raise BinanceAPIException("Spot trading not enabled")
         except BinanceAPIException as e:
-            logger.error(f"Failed to verify spot trading access: {e}")
+            logger.error("Failed to verify spot trading access: %s", e)
             raise e
 
 def main():
@@ -484,91 +526,88 @@ def main():
     console.print("[bold blue]Initializing bot...[/bold blue]")
     bot = BasicBot(API_KEY, API_SECRET)
 
-    while True:
-        # Create mode selection table
-        table = Table(title="Available Options", show_header=True, header_style="bold magenta")
-        table.add_column("Mode", style="cyan")
-        table.add_column("Description", style="green")
-        table.add_row("MARKET", "Instant execution at market price")
-        table.add_row("LIMIT", "Place order at specific price")
-        table.add_row("STOP_MARKET", "Market order triggered at stop price")
-        table.add_row("TWAP", "Time-Weighted Average Price execution")
-        table.add_row("GRID", "Grid trading strategy")
-        table.add_row("ACCOUNT", "View account balances")
-        table.add_row("EXIT", "Exit the program")
-        console.print(table)
-
-        valid_modes = ["MARKET", "LIMIT", "STOP_MARKET", "TWAP", "GRID", "ACCOUNT", "EXIT"]
+    # The mode menu never changes, so build it once and reprint it each round
+    mode_table = Table(title="Available Options", show_header=True, header_style="bold magenta")
+    mode_table.add_column("Mode", style="cyan")
+    mode_table.add_column("Description", style="green")
+    for mode_name, description in TRADING_MODES.items():
+        mode_table.add_row(mode_name, description)
+
+    try:
         while True:
-            mode_input = Prompt.ask("Choose mode")
-            mode = mode_input.upper() # Convert input to uppercase
-            if mode in valid_modes:
+            console.print(mode_table)
+
+            while True:
+                mode_input = Prompt.ask("Choose mode")
+                mode = mode_input.upper() # Convert input to uppercase
+                if mode in TRADING_MODES:
+                    break
+                else:
+                    # Provide a more helpful error message
+                    console.print(
+                        f"[yellow]Invalid mode '[bold]{mode_input}[/bold]'. Please choose from the available options. "
+                        f"Ensure you are using full uppercase mode names (e.g., MARKET, LIMIT, TWAP).[/yellow]"
+                    )
+
+            if mode == "EXIT":
+                console.print("[bold blue]Shutting down bot...[/bold blue]")
+                console.print("[bold blue]Thank you for using Binance Trading Bot![/bold blue]")
                 break
-            else:
-                # Provide a more helpful error message
-                console.print(
-                    f"[yellow]Invalid mode '[bold]{mode_input}[/bold]'. Please choose from the available options. "
-                    f"Ensure you are using full uppercase mode names (e.g., MARKET, LIMIT, TWAP).[/yellow]"
-                )
 
-        if mode == "EXIT":
-            console.print("[bold blue]Shutting down bot...[/bold blue]")
-            bot.twm.stop()  # Clean up WebSocket connection
-            console.print("[bold blue]Thank you for using Binance Trading Bot![/bold blue]")
-            break
+            if mode == "ACCOUNT":
+                bot.get_account_info()
+                continue
 
-        if mode == "ACCOUNT":
-            bot.get_account_info()
-            continue
+            # Symbol selection with validation
+            raw_symbol_input = Prompt.ask("Symbol", default=DEFAULT_SYMBOL)
+            symbol_input_upper = raw_symbol_input.upper()
 
-        # Symbol selection with validation
-        raw_symbol_input = Prompt.ask("Symbol", default=DEFAULT_SYMBOL)
-        symbol_input_upper = raw_symbol_input.upper()
+            if symbol_input_upper in TRADING_PAIRS:
+                symbol = TRADING_PAIRS[symbol_input_upper]
+                if symbol != symbol_input_upper: # Inform only if a conversion happened
+                     console.print(f"[cyan]Interpreting '[bold]{raw_symbol_input}[/bold]' as '[bold]{symbol}[/bold]'[/cyan]")
+            else:
+                symbol = symbol_input_upper # Use the uppercased input directly if not in TRADING_PAIRS
 
-        if symbol_input_upper in TRADING_PAIRS:
-            symbol = TRADING_PAIRS[symbol_input_upper]
-            if symbol != symbol_input_upper: # Inform only if a conversion happened
-                 console.print(f"[cyan]Interpreting '[bold]{raw_symbol_input}[/bold]' as '[bold]{symbol}[/bold]'[/cyan]")
-        else:
-            symbol = symbol_input_upper # Use the uppercased input directly if not in TRADING_PAIRS
+            try:
+                symbol_info = bot.validate_symbol(symbol)
+                console.print(f"[green]Trading pair {symbol} validated successfully[/green]")
+            except (BinanceAPIException, ValueError) as e:
+                console.print(f"[red]Error: {str(e)}[/red]")
+                continue
 
-        try:
-            symbol_info = bot.validate_symbol(symbol)
-            console.print(f"[green]Trading pair {symbol} validated successfully[/green]")
-        except (BinanceAPIException, ValueError) as e:
-            console.print(f"[red]Error: {str(e)}[/red]")
-            continue
-
-        if mode in ['MARKET', 'LIMIT', 'STOP_MARKET']:
-            side = Prompt.ask("Side", choices=["BUY", "SELL"])
-            qty = get_float("Quantity")
-            price = stop_price = None
-
-            if mode == 'LIMIT':
-                price = get_float("Limit Price")
-            elif mode == 'STOP_MARKET':
-                stop_price = get_float("Stop Price")
-
-            bot.place_order(symbol, side, mode, qty, price, stop_price)
-
-        elif mode == 'TWAP':
-            side = Prompt.ask("Side", choices=["BUY", "SELL"])
-            total_qty = get_float("Total Quantity")
-            slices = int(get_float("Number of Slices"))
-            interval = get_float("Interval (seconds)")
-            bot.twap(symbol, side, total_qty, interval, slices)
-
-        elif mode == 'GRID':
-            side = Prompt.ask("Base side for grid", choices=["BUY", "SELL"])
-            lower = get_float("Lower Price")
-            upper = get_float("Upper Price")
-            grids = int(get_float("Number of Grid Levels"))
-            qty = get_float("Quantity per order")
-            bot.grid(symbol, lower, upper, grids, qty, side)
-
-        if not Confirm.ask("\nWould you like to perform another action?"):
-            console.print("[bold blue]Thank you for using Binance Trading Bot![/bold blue]")
-            break
+            if mode in ['MARKET', 'LIMIT', 'STOP_MARKET']:
+                side = Prompt.ask("Side", choices=["BUY", "SELL"])
+                qty = get_float("Quantity")
+                price = stop_price = None
+
+                if mode == 'LIMIT':
+                    price = get_float("Limit Price")
+                elif mode == 'STOP_MARKET':
+                    stop_price = get_float("Stop Price")
+
+                bot.place_order(symbol, side, mode, qty, price, stop_price, symbol_info=symbol_info)
+
+            elif mode == 'TWAP':
+                side = Prompt.ask("Side", choices=["BUY", "SELL"])
+                total_qty = get_float("Total Quantity")
+                slices = int(get_float("Number of Slices"))
+                interval = get_float("Interval (seconds)")
+                bot.twap(symbol, side, total_qty, interval, slices, symbol_info=symbol_info)
+
+            elif mode == 'GRID':
+                side = Prompt.ask("Base side for grid", choices=["BUY", "SELL"])
+                lower = get_float("Lower Price")
+                upper = get_float("Upper Price")
+                grids = int(get_float("Number of Grid Levels"))
+                qty = get_float("Quantity per order")
+                bot.grid(symbol, lower, upper, grids, qty, side, symbol_info=symbol_info)
+
+            if not Confirm.ask("\nWould you like to perform another action?"):
+                console.print("[bold blue]Thank you for using Binance Trading Bot![/bold blue]")
+                break
+    finally:
+        bot.twm.stop()  # Clean up WebSocket connection on every exit path
 
 def get_float(prompt):
     while True:
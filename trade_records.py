@@ -39,7 +39,7 @@ def log_error(error_message):
     """
     Logs an error message.
     """
-    logger.error(f"Error Log: {error_message}")
+    logger.error("Error Log: %s", error_message)
 
 if __name__ == '__main__':
     # Example usage for testing this module directly